@@ -12,6 +12,7 @@ Usage:
     python convert_chrome_bookmarks.py bookmarks.html --output my_bookmarks.json
     python convert_chrome_bookmarks.py bookmarks.html --split-by-folder
     python convert_chrome_bookmarks.py bookmarks.html --output-dir ../public/bm_json/
+    python convert_chrome_bookmarks.py bookmarks.html --no-dedup
 
 Chrome Export Instructions:
     1. Open Chrome
@@ -22,17 +23,90 @@ Chrome Export Instructions:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import html
+import itertools
 import json
 import os
 import re
 import sys
-from datetime import datetime
-from html.parser import HTMLParser
+import time
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterable, Iterator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ChromeBookmarkParser(HTMLParser):
+
+# Shared by tag cleaning and folder filename sanitization
+_TAG_STRIP_RE = re.compile(r'[^\w\s-]')
+_TAG_SPACE_RE = re.compile(r'\s+')
+
+# ASCII equivalent of _TAG_STRIP_RE for str.translate: drop everything that
+# is not a word character, whitespace or '-'
+_TAG_DROP_TABLE = {
+    c: None for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+}
+
+# Tokenizer for the Netscape bookmark format: captures an optional closing
+# slash, the tag name, its raw attributes and the text that follows it.
+# Of the anchor attributes only HREF and ADD_DATE are needed.
+_BM_TOKEN_RE = re.compile(r'<(/?)(H3|A|DL)(?:\s+([^>]*))?>([^<]*)', re.IGNORECASE)
+_BM_ATTR_RE = re.compile(r'\b(HREF|ADD_DATE)="([^"]*)"', re.IGNORECASE)
+
+# Scheme and authority of a URL, the only parts that are case-insensitive
+_URL_AUTHORITY_RE = re.compile(r'[^:/?#]+://[^/?#]*')
+
+# Only links with these schemes are kept (skips javascript:, chrome:// etc)
+_HTTP_SCHEMES = ('http://', 'https://')
+
+# Bookmark files are read in chunks of this many characters
+_READ_CHUNK_SIZE = 64 * 1024
+
+# JSON output is buffered in blocks of this many bytes, so the small
+# per-item writes reach the OS as a few large ones
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# JSON encoder: orjson when it's installed, the standard library otherwise.
+# Both produce UTF-8 bytes in the json.dump(indent=2) layout.
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Common domain-to-tag mappings, matched against the host and its parents
+_EXACT_HOST_TAGS = {
+    'github.com': ('development', 'code'),
+    'stackoverflow.com': ('development', 'qa'),
+    'youtube.com': ('video', 'media'),
+    'twitter.com': ('social',),
+    'x.com': ('social',),
+    'reddit.com': ('social', 'community'),
+    'medium.com': ('blog', 'articles'),
+    'dev.to': ('development', 'blog'),
+}
+
+# Subdomain prefixes that hint at the kind of site, checked in order
+_PREFIX_TAGS = (
+    ('docs.', ('documentation',)),
+    ('learn.', ('learning', 'tutorial')),
+    ('news.', ('news',)),
+)
+
+# Generic folder names that make poor tags
+_SKIP_TAGS = frozenset({'bookmarks-bar', 'bookmarks', 'other-bookmarks', 'mobile-bookmarks', 'imported'})
+
+# Limit on tags per bookmark
+_MAX_TAGS = 5
+
+
+class ChromeBookmarkParser:
     """
     Parses Chrome's exported HTML bookmarks file.
     
@@ -44,97 +118,146 @@ class ChromeBookmarkParser(HTMLParser):
             </DL>
         </DT>
     </DL>
+    
+    The export is a very regular Netscape bookmark file, so instead of
+    driving html.parser's per-character state machine we scan it with a
+    single compiled regex that only picks out the H3/A/DL tags we need.
     """
     
     def __init__(self):
-        super().__init__()
         self.bookmarks = []
         self.folder_stack = []  # Track nested folders
-        self.current_bookmark = None
-        self.in_anchor = False
-        self.in_folder_title = False
+        self._stack_snapshot = ()  # Immutable copy shared by sibling bookmarks
+        self._folder_path = ''  # '/'.join(folder_stack), kept in step with it
+        self._pending = ''  # Unscanned tail that may hold a partial tag
         
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
+    def feed(self, chunk: str):
+        """Scan a chunk of HTML, holding back anything after the last '<'."""
+        chunk = self._pending + chunk
+        cut = chunk.rfind('<')
+        if cut <= 0:
+            self._pending = chunk
+            return
+        self._pending = chunk[cut:]
+        self._scan(chunk[:cut])
         
-        if tag == 'h3':
-            # Starting a folder title
-            self.in_folder_title = True
-            
-        elif tag == 'a':
-            # Starting a bookmark link
-            self.in_anchor = True
-            href = attrs_dict.get('href', '')
-            add_date = attrs_dict.get('add_date', '')
-            
-            # Parse the timestamp (Chrome uses Unix timestamp in seconds)
-            created_at = None
-            if add_date:
-                try:
-                    timestamp = int(add_date)
-                    created_at = datetime.fromtimestamp(timestamp).isoformat() + 'Z'
-                except (ValueError, OSError):
-                    pass
-            
-            self.current_bookmark = {
-                'url': href,
-                'created_at': created_at,
-                'tags': list(self.folder_stack),  # Copy current folder path as tags
-                'folder_path': '/'.join(self.folder_stack) if self.folder_stack else 'Uncategorized'
-            }
-            
-        elif tag == 'dl':
-            # Entering a new nested list (folder contents)
-            pass
-            
-    def handle_endtag(self, tag):
-        if tag == 'h3':
-            self.in_folder_title = False
+    def close(self):
+        """Scan whatever is still held back once the input is exhausted."""
+        self._scan(self._pending)
+        self._pending = ''
+        
+    def _scan(self, html_content: str):
+        for match in _BM_TOKEN_RE.finditer(html_content):
+            closing, tag, attr_text, data = match.groups()
+            tag = tag.lower()
             
-        elif tag == 'a':
-            self.in_anchor = False
-            if self.current_bookmark and self.current_bookmark.get('url'):
-                # Only save bookmarks with valid URLs (skip javascript: etc)
-                url = self.current_bookmark['url']
-                if url.startswith(('http://', 'https://')):
-                    self.bookmarks.append(self.current_bookmark)
-            self.current_bookmark = None
+            if closing:
+                if tag == 'dl':
+                    # Exiting a folder
+                    if self.folder_stack:
+                        self.folder_stack.pop()
+                        self._stack_snapshot = tuple(self.folder_stack)
+                        self._folder_path = '/'.join(self.folder_stack)
+                continue
             
-        elif tag == 'dl':
-            # Exiting a folder
-            if self.folder_stack:
-                self.folder_stack.pop()
+            if tag == 'h3':
+                # This is a folder name
+                data = _text_content(data)
+                if data:
+                    self.folder_stack.append(sys.intern(data))
+                    self._stack_snapshot = tuple(self.folder_stack)
+                    self._folder_path = f'{self._folder_path}/{data}' if self._folder_path else data
+                    
+            elif tag == 'a':
+                # Starting a bookmark link
+                href = add_date = ''
+                for name, value in _BM_ATTR_RE.findall(attr_text or ''):
+                    if name.lower() == 'href':
+                        href = value
+                    else:
+                        add_date = value
                 
-    def handle_data(self, data):
-        data = data.strip()
-        if not data:
-            return
-            
-        if self.in_folder_title:
-            # This is a folder name
-            self.folder_stack.append(data)
-            
-        elif self.in_anchor and self.current_bookmark:
-            # This is a bookmark title
-            self.current_bookmark['title'] = data
+                # Only save bookmarks with valid URLs (skip javascript: etc),
+                # before any other work is spent on the entry
+                if not href.startswith(_HTTP_SCHEMES):
+                    continue
+                if '&' in href:
+                    href = html.unescape(href)
+                
+                # Parse the timestamp (Chrome uses Unix timestamp in seconds)
+                created_at = None
+                if add_date:
+                    try:
+                        tm = time.gmtime(int(add_date))
+                        # Years outside 1-9999 aren't valid ISO 8601 dates
+                        # (e.g. millisecond timestamps), so leave them unset
+                        if 1 <= tm.tm_year <= 9999:
+                            created_at = '%04d-%02d-%02dT%02d:%02d:%02dZ' % tm[:6]
+                    except (ValueError, OverflowError, OSError):
+                        pass
+                
+                bookmark = {
+                    'url': href,
+                    'created_at': created_at,
+                    'tags': self._stack_snapshot,  # Current folder path as tags
+                    'folder_path': self._folder_path or 'Uncategorized'
+                }
+                data = _text_content(data)
+                if data:
+                    # This is a bookmark title
+                    bookmark['title'] = data
+                self.bookmarks.append(bookmark)
 
 
+def _text_content(data: str) -> str:
+    """Unescape and strip the text that follows a tag."""
+    # Unescape first so entity padding such as &nbsp; is stripped too
+    if '&' in data:
+        data = html.unescape(data)
+    return data.strip()
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """Extract clean domain from URL."""
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        return domain.replace('www.', '')
-    except:
+    # Only the host is needed, so slice it out rather than running urlparse
+    start = url.find('://')
+    if start < 0:
         return ''
+    domain = url[start + 3:]
+    for sep in '/?#':
+        end = domain.find(sep)
+        if end >= 0:
+            domain = domain[:end]
+    
+    # Drop any user:password@ prefix and :port suffix
+    at = domain.rfind('@')
+    if at >= 0:
+        domain = domain[at + 1:]
+    if domain.startswith('['):
+        # Bracketed IPv6 literal: its colons are part of the address
+        domain = domain[:domain.find(']') + 1]
+    else:
+        colon = domain.find(':')
+        if colon >= 0:
+            domain = domain[:colon]
+    
+    domain = domain.lower()
+    return domain[4:] if domain.startswith('www.') else domain
 
 
+@functools.lru_cache(maxsize=2048)
 def clean_tag(tag: str) -> str:
-    """Clean and normalize a tag string."""
+    """Clean and normalize a tag string (cached: folder names repeat a lot)."""
     # Remove special characters, convert to lowercase
-    tag = re.sub(r'[^\w\s-]', '', tag.lower())
-    tag = re.sub(r'\s+', '-', tag.strip())
-    return tag
+    if tag.isascii():
+        # split() strips and collapses whitespace runs in one C-level pass
+        tag = '-'.join(tag.lower().translate(_TAG_DROP_TABLE).split())
+    else:
+        tag = _TAG_STRIP_RE.sub('', tag.lower())
+        tag = _TAG_SPACE_RE.sub('-', tag.strip())
+    # Folder names that clean to the same tag then share one string object
+    return sys.intern(tag)
 
 
 def generate_tags_from_url(url: str) -> list:
@@ -142,53 +265,51 @@ def generate_tags_from_url(url: str) -> list:
     domain = extract_domain(url)
     if not domain:
         return []
-    
-    # Common domain-to-tag mappings
-    tag_mappings = {
-        'github.com': ['development', 'code'],
-        'stackoverflow.com': ['development', 'qa'],
-        'youtube.com': ['video', 'media'],
-        'twitter.com': ['social'],
-        'x.com': ['social'],
-        'reddit.com': ['social', 'community'],
-        'medium.com': ['blog', 'articles'],
-        'dev.to': ['development', 'blog'],
-        'docs.': ['documentation'],
-        'learn.': ['learning', 'tutorial'],
-        'news.': ['news'],
-    }
-    
-    tags = []
-    for pattern, mapped_tags in tag_mappings.items():
-        if pattern in domain:
-            tags.extend(mapped_tags)
+    return list(domain_tags(domain))
+
+
+@functools.lru_cache(maxsize=4096)
+def domain_tags(domain: str) -> tuple:
+    """Map a domain to its tags; cached since many bookmarks share a host."""
+    # Known sites, including their subdomains (gist.github.com, m.youtube.com)
+    host = domain
+    while True:
+        tags = _EXACT_HOST_TAGS.get(host)
+        if tags:
+            return tags
+        dot = host.find('.')
+        if dot < 0:
             break
+        host = host[dot + 1:]
+    
+    for prefix, tags in _PREFIX_TAGS:
+        if domain.startswith(prefix):
+            return tags
     
-    return tags
+    return ()
 
 
 def convert_bookmark(bookmark: dict, source: str) -> dict:
     """Convert parsed bookmark to webapp JSON format."""
-    # Clean and dedupe tags
-    folder_tags = [clean_tag(t) for t in bookmark.get('tags', []) if t]
-    url_tags = generate_tags_from_url(bookmark.get('url', ''))
-    
-    # Combine and deduplicate tags
-    all_tags = []
+    # Clean folder tags, add URL tags, dedupe and drop generic folder names
+    # in a single pass that stops once the tag limit is reached
+    tags = []
     seen = set()
-    for tag in folder_tags + url_tags:
-        if tag and tag not in seen:
-            all_tags.append(tag)
+    candidates = itertools.chain(
+        map(clean_tag, bookmark.get('tags', ())),
+        generate_tags_from_url(bookmark.get('url', '')),
+    )
+    for tag in candidates:
+        if tag and tag not in _SKIP_TAGS and tag not in seen:
             seen.add(tag)
-    
-    # Filter out generic folder names
-    skip_tags = {'bookmarks-bar', 'bookmarks', 'other-bookmarks', 'mobile-bookmarks', 'imported'}
-    all_tags = [t for t in all_tags if t not in skip_tags]
+            tags.append(tag)
+            if len(tags) == _MAX_TAGS:
+                break
     
     return {
         'title': bookmark.get('title', 'Untitled'),
         'url': bookmark.get('url', ''),
-        'tags': all_tags[:5],  # Limit to 5 tags
+        'tags': tags,
         'description': '',  # Chrome doesn't export descriptions
         'archived': False,
         'created_at': bookmark.get('created_at'),
@@ -196,15 +317,42 @@ def convert_bookmark(bookmark: dict, source: str) -> dict:
     }
 
 
-def parse_chrome_bookmarks(html_content: str) -> list:
-    """Parse Chrome bookmarks HTML and return list of bookmarks."""
+def parse_chrome_bookmarks(html_file) -> Iterator[dict]:
+    """Parse a Chrome bookmarks HTML file, yielding bookmarks as they are found."""
     parser = ChromeBookmarkParser()
-    parser.feed(html_content)
-    return parser.bookmarks
+    for chunk in iter(lambda: html_file.read(_READ_CHUNK_SIZE), ''):
+        parser.feed(chunk)
+        yield from parser.bookmarks
+        parser.bookmarks.clear()
+    parser.close()
+    yield from parser.bookmarks
+
+
+def _dedupe_key(url: str) -> str:
+    """Normalize a URL for duplicate detection.
+    
+    Only the scheme and host are case-insensitive, so the path, query and
+    fragment are kept as written; a lone '/' path is treated as empty.
+    """
+    match = _URL_AUTHORITY_RE.match(url)
+    if not match:
+        return url
+    rest = url[match.end():]
+    return match.group().lower() + ('' if rest == '/' else rest)
 
 
-def group_by_folder(bookmarks: list) -> dict:
-    """Group bookmarks by their top-level folder."""
+def dedupe_bookmarks(bookmarks: Iterable[dict]) -> Iterator[dict]:
+    """Drop bookmarks whose URL was already seen."""
+    seen = set()
+    for bookmark in bookmarks:
+        key = _dedupe_key(bookmark['url'])
+        if key not in seen:
+            seen.add(key)
+            yield bookmark
+
+
+def group_by_folder(bookmarks: Iterable[dict], source: str) -> dict:
+    """Convert bookmarks and group them by their top-level folder."""
     groups = {}
     for bookmark in bookmarks:
         folder_path = bookmark.get('folder_path', 'Uncategorized')
@@ -213,17 +361,43 @@ def group_by_folder(bookmarks: list) -> dict:
         
         if top_folder not in groups:
             groups[top_folder] = []
-        groups[top_folder].append(bookmark)
+        groups[top_folder].append(convert_bookmark(bookmark, source))
     
     return groups
 
 
-def save_json(data: dict, output_path: Path):
-    """Save data as formatted JSON."""
+def collect_tags(bookmarks: Iterable[dict], tags: set) -> Iterator[dict]:
+    """Pass converted bookmarks through, recording their tags along the way."""
+    for bookmark in bookmarks:
+        tags.update(bookmark['tags'])
+        yield bookmark
+
+
+def save_json(title: str, items: Iterable[dict], output_path: Path) -> int:
+    """Stream bookmarks to disk as formatted JSON, returning how many were written.
+    
+    Items are written to a temporary file next to ``output_path`` that only
+    replaces it once everything was written, so a failure part way through
+    (e.g. undecodable input) never leaves a truncated file behind.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Saved: {output_path} ({len(data['items'])} bookmarks)")
+    tmp_path = output_path.with_name(f'.{output_path.name}.{os.getpid()}.tmp')
+    count = 0
+    try:
+        with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            # Same layout as json.dump(..., indent=2), written one item at a time
+            f.write(b'{\n  "title": ' + _dumps(title) + b',\n  "items": [')
+            for item in items:
+                f.write(b',\n    ' if count else b'\n    ')
+                f.write(_dumps(item).replace(b'\n', b'\n    '))
+                count += 1
+            f.write(b'\n  ]\n}' if count else b']\n}')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    print(f"✅ Saved: {output_path} ({count} bookmarks)")
+    return count
 
 
 def main():
@@ -278,6 +452,19 @@ Examples:
         help='Minimum bookmarks required to create a folder file (default: 1)'
     )
     
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Keep bookmarks whose URL duplicates an earlier one'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count(),
+        help='Folder files written in parallel with --split-by-folder (default: CPU count)'
+    )
+    
     args = parser.parse_args()
     
     # Validate input file
@@ -285,81 +472,99 @@ Examples:
         print(f"❌ Error: File not found: {args.input_file}")
         sys.exit(1)
     
-    # Read and parse the HTML file
+    # Open the HTML file; it is read incrementally while parsing
     print(f"📖 Reading: {args.input_file}")
     try:
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        html_file = open(args.input_file, 'r', encoding='utf-8')
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         sys.exit(1)
     
-    # Parse bookmarks
-    print("🔍 Parsing bookmarks...")
-    raw_bookmarks = parse_chrome_bookmarks(html_content)
-    print(f"   Found {len(raw_bookmarks)} bookmarks")
-    
-    if not raw_bookmarks:
-        print("❌ No bookmarks found in file")
-        sys.exit(1)
-    
-    # Convert to webapp format
-    bookmarks = [convert_bookmark(b, args.source) for b in raw_bookmarks]
-    
-    # Determine output path(s)
-    if args.output_dir:
-        output_dir = args.output_dir
-    else:
-        output_dir = args.input_file.parent
-    
-    if args.split_by_folder:
-        # Group by folder and save separately
-        groups = group_by_folder(raw_bookmarks)
-        print(f"📁 Found {len(groups)} folders")
-        
-        for folder_name, folder_bookmarks in groups.items():
-            if len(folder_bookmarks) < args.min_bookmarks:
-                print(f"   Skipping '{folder_name}' ({len(folder_bookmarks)} bookmarks < min {args.min_bookmarks})")
-                continue
+    # Decoding happens lazily while bookmarks stream to disk, so read errors
+    # can surface at any point below
+    try:
+        with html_file:
+            # Parse bookmarks
+            print("🔍 Parsing bookmarks...")
+            raw_bookmarks = parse_chrome_bookmarks(html_file)
+            first = next(raw_bookmarks, None)
             
-            # Convert bookmarks
-            converted = [convert_bookmark(b, args.source) for b in folder_bookmarks]
+            if first is None:
+                print("❌ No bookmarks found in file")
+                sys.exit(1)
+            raw_bookmarks = itertools.chain([first], raw_bookmarks)
             
-            # Create safe filename
-            safe_name = re.sub(r'[^\w\s-]', '', folder_name.lower())
-            safe_name = re.sub(r'\s+', '_', safe_name.strip())
-            if not safe_name:
-                safe_name = 'uncategorized'
+            # Skip duplicates (same page saved twice, synced or merged exports)
+            if not args.no_dedup:
+                raw_bookmarks = dedupe_bookmarks(raw_bookmarks)
             
-            output_data = {
-                'title': folder_name,
-                'items': converted
-            }
+            # Determine output path(s)
+            if args.output_dir:
+                output_dir = args.output_dir
+            else:
+                output_dir = args.input_file.parent
             
-            output_path = output_dir / f"{safe_name}.json"
-            save_json(output_data, output_path)
-    else:
-        # Save all bookmarks to a single file
-        if args.output:
-            output_path = args.output
-        else:
-            output_path = output_dir / f"{args.input_file.stem}.json"
-        
-        output_data = {
-            'title': f'Imported from {args.source}',
-            'items': bookmarks
-        }
-        
-        save_json(output_data, output_path)
+            all_tags = set()
+            
+            if args.split_by_folder:
+                # Convert once while grouping by folder, then save separately
+                groups = group_by_folder(raw_bookmarks, args.source)
+                total = sum(map(len, groups.values()))
+                all_tags.update(itertools.chain.from_iterable(
+                    b['tags'] for b in itertools.chain.from_iterable(groups.values())))
+                print(f"   Found {total} bookmarks")
+                print(f"📁 Found {len(groups)} folders")
+                
+                tasks = []
+                used_names = set()
+                for folder_name, folder_bookmarks in groups.items():
+                    if len(folder_bookmarks) < args.min_bookmarks:
+                        print(f"   Skipping '{folder_name}' ({len(folder_bookmarks)} bookmarks < min {args.min_bookmarks})")
+                        continue
+                    
+                    # Create safe filename
+                    safe_name = _TAG_STRIP_RE.sub('', folder_name.lower())
+                    safe_name = _TAG_SPACE_RE.sub('_', safe_name.strip())
+                    if not safe_name:
+                        safe_name = 'uncategorized'
+                    
+                    # Folders like 'Work' and 'WORK!' sanitize to the same
+                    # name; number the later ones so no two tasks share a file
+                    unique_name = safe_name
+                    suffix = 2
+                    while unique_name in used_names:
+                        unique_name = f"{safe_name}_{suffix}"
+                        suffix += 1
+                    used_names.add(unique_name)
+                    safe_name = unique_name
+                    
+                    output_path = output_dir / f"{safe_name}.json"
+                    tasks.append((folder_name, folder_bookmarks, output_path))
+                
+                # Each folder file is independent, so write them concurrently
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max(args.jobs or 1, 1)) as executor:
+                    list(executor.map(lambda task: save_json(*task), tasks))
+            else:
+                # Convert and save all bookmarks to a single file as they are parsed
+                if args.output:
+                    output_path = args.output
+                else:
+                    output_path = output_dir / f"{args.input_file.stem}.json"
+                
+                bookmarks = (convert_bookmark(b, args.source) for b in raw_bookmarks)
+                total = save_json(f'Imported from {args.source}',
+                                  collect_tags(bookmarks, all_tags), output_path)
+                print(f"   Found {total} bookmarks")
+    except UnicodeDecodeError as e:
+        print(f"❌ Error reading file: {e}")
+        sys.exit(1)
+    except OSError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
     
     # Print summary
     print("\n📊 Summary:")
-    print(f"   Total bookmarks processed: {len(bookmarks)}")
-    
-    # Count tags
-    all_tags = set()
-    for b in bookmarks:
-        all_tags.update(b.get('tags', []))
+    print(f"   Total bookmarks processed: {total}")
     print(f"   Unique tags generated: {len(all_tags)}")
     
     # Show sample of tags